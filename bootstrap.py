@@ -0,0 +1,48 @@
+"""Startup data loading for the dashboard.
+
+Excel parsing through openpyxl dominates boot time, so the dashboard
+prefers Parquet: either the cleaner's native Parquet export or the
+processed cache this module writes next to the Excel file. Both are
+columnar reads with dtypes preserved; only a fresh Excel export pays the
+XML parse plus metric computation.
+"""
+import logging
+import os
+
+import pandas as pd
+
+from calculations import calculate_metrics
+
+
+def load_dashboard_frame(source_path, load_excel=None):
+    """Loads the processed dashboard frame, preferring Parquet.
+
+    `<stem>.parquet` (the cleaner's export, or the cache written below) is
+    read directly whenever it is at least as new as `<stem>.xlsx`.
+    Otherwise the Excel file is parsed once (via `load_excel` when given,
+    else pd.read_excel), run through calculate_metrics, and cached as
+    Parquet for the next boot.
+    """
+    base = os.path.splitext(source_path)[0]
+    parquet_path = base + '.parquet'
+    excel_path = base + '.xlsx'
+
+    if os.path.exists(parquet_path) and (
+            not os.path.exists(excel_path)
+            or os.path.getmtime(parquet_path) >= os.path.getmtime(excel_path)):
+        df = pd.read_parquet(parquet_path)
+        # The cleaner's raw export lacks the computed columns; the cache
+        # written below already carries them.
+        return df if 'MTTR' in df.columns else calculate_metrics(df)
+
+    raw = load_excel(excel_path) if load_excel is not None else pd.read_excel(excel_path)
+    df = calculate_metrics(raw)
+
+    try:
+        df.to_parquet(parquet_path, compression='zstd')
+    except Exception as e:
+        # Missing pyarrow or an unwritable data dir just means the next
+        # boot parses Excel again.
+        logging.warning(f"Could not write parquet cache {parquet_path}: {e}")
+
+    return df
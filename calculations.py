@@ -1,12 +1,24 @@
 import pandas as pd
 import numpy as np
 from datetime import timedelta, datetime  # Added datetime here
-import plotly.graph_objects as go
-from dash import html, dcc
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 import logging
+import queue
+import threading
+
+# plotly/dash and smtplib/email are imported lazily inside the functions
+# that need them, so batch callers of calculate_metrics don't pay the
+# plotly import (~300 ms and tens of MB) at module load.
+
+# Optional JIT-compiled kernels; the NumPy paths below are the fallback.
+try:
+    from _kernels import business_minutes_njit, mttr_day_stats_njit, zscore_last_njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Below this row count the NumPy kernels win; above it the compiled,
+# allocation-free numba loops take over.
+NUMBA_MIN_ROWS = 50_000
 
 # --- LOGGING SETUP ---
 logging.basicConfig(
@@ -15,6 +27,22 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# One canonical definition per symbol lives in this module; the public
+# surface is pinned here so accidental re-definitions stand out.
+__all__ = [
+    'send_email_alert',
+    'format_duration',
+    'format_duration_vec',
+    'get_swedish_business_hours',
+    'business_minutes_vectorized',
+    'detect_metric_anomaly',
+    'detect_metric_anomaly_batch',
+    'log_anomaly',
+    'calculate_metrics',
+    'get_fcr_gauges',
+    'get_mttr_trend_data',
+]
+
 # Global tracker to prevent email spam (Cool-down: 4 hours)
 last_alert_sent = {}
 
@@ -28,21 +56,76 @@ EMAIL_PASSWORD = "your-app-password"
 
 # --- HELPERS ---
 
+# Background SMTP worker: alerts are queued and sent off-thread over one
+# persistent connection, so dashboard callbacks never wait on SMTP
+# round-trips. Pending subjects are tracked to drop duplicate enqueues
+# during alert storms (on top of the 4-hour cool-down).
+_alert_queue = queue.Queue()
+_pending_alerts = set()
+_alert_lock = threading.Lock()
+_smtp_thread = None
+
+
+def _connect_smtp():
+    import smtplib
+    server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+    server.starttls()
+    server.login(SENDER_EMAIL, EMAIL_PASSWORD)
+    return server
+
+
+def _smtp_worker():
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
+    server = None
+    while True:
+        try:
+            subject, body = _alert_queue.get(timeout=60)
+        except queue.Empty:
+            # Idle: keep the connection alive between alerts.
+            if server is not None:
+                try:
+                    server.noop()
+                except smtplib.SMTPException:
+                    server = None
+            continue
+
+        try:
+            msg = MIMEMultipart()
+            msg['From'] = SENDER_EMAIL
+            msg['To'] = RECEIVER_EMAIL
+            msg['Subject'] = subject
+            msg.attach(MIMEText(body, 'plain'))
+
+            if server is None:
+                server = _connect_smtp()
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                server = _connect_smtp()
+                server.send_message(msg)
+        except Exception as e:
+            logging.error(f"Failed to send email: {e}")
+            server = None
+        finally:
+            with _alert_lock:
+                _pending_alerts.discard(subject)
+            _alert_queue.task_done()
+
+
 def send_email_alert(subject, body):
-    """Sends a formatted email alert via SMTP."""
-    try:
-        msg = MIMEMultipart()
-        msg['From'] = SENDER_EMAIL
-        msg['To'] = RECEIVER_EMAIL
-        msg['Subject'] = subject
-        msg.attach(MIMEText(body, 'plain'))
-
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(SENDER_EMAIL, EMAIL_PASSWORD)
-            server.send_message(msg)
-    except Exception as e:
-        logging.error(f"Failed to send email: {e}")
+    """Queues an email alert for the background SMTP worker (non-blocking)."""
+    global _smtp_thread
+    with _alert_lock:
+        if _smtp_thread is None or not _smtp_thread.is_alive():
+            _smtp_thread = threading.Thread(target=_smtp_worker, daemon=True)
+            _smtp_thread.start()
+        if subject in _pending_alerts:
+            return
+        _pending_alerts.add(subject)
+    _alert_queue.put_nowait((subject, body))
 
 
 def format_duration(td):
@@ -55,21 +138,99 @@ def format_duration(td):
     return f"{days:02}:{hours:02}:{minutes:02}:{seconds:02}"
 
 
+def format_duration_vec(seconds: np.ndarray) -> pd.Series:
+    """Formats an int64 seconds array into DD:HH:MM:SS strings in bulk.
+
+    Vectorized counterpart of format_duration: np.divmod splits the parts
+    and pandas .str ops build the strings, so no per-row Python call.
+    """
+    negative = seconds < 0
+    s = np.where(negative, 0, seconds)
+    days, rem = np.divmod(s, 86400)
+    hours, rem = np.divmod(rem, 3600)
+    minutes, secs = np.divmod(rem, 60)
+    d, h, m, sec = (pd.Series(part).astype(str).str.zfill(2) for part in (days, hours, minutes, secs))
+    return (d + ':' + h + ':' + m + ':' + sec).mask(negative, "00:00:00:00")
+
+
+# Swedish business windows per weekday (Mon-Fri 07-18, Sat-Sun 08-16),
+# expressed as minutes so the vectorized path stays in integer arithmetic.
+DAILY_BUSINESS_MINUTES = np.array([11 * 60] * 5 + [8 * 60] * 2, dtype=np.int64)
+BUSINESS_WINDOWS = np.array([[7 * 60, 18 * 60]] * 5 + [[8 * 60, 16 * 60]] * 2, dtype=np.int64)
+
+
 def get_swedish_business_hours(row):
-    """Calculates business time based on Swedish work windows."""
+    """Calculates business time based on Swedish work windows.
+
+    Walks one step per calendar day and clips that day's business window
+    against the ticket interval, instead of materializing a per-minute
+    date_range just to count its entries.
+    """
     start, end = row['Created'], row['Resolved']
     if pd.isnull(start) or pd.isnull(end) or end <= start:
         return timedelta(0)
 
-    time_range = pd.date_range(start=start, end=end, freq='min')
-    day_of_week = time_range.weekday
-    hour = time_range.hour
+    total = timedelta(0)
+    for day in pd.date_range(start.normalize(), end.normalize(), freq='D'):
+        open_minute, close_minute = BUSINESS_WINDOWS[day.weekday()]
+        window_start = day + timedelta(minutes=int(open_minute))
+        window_end = day + timedelta(minutes=int(close_minute))
+        overlap = min(end, window_end) - max(start, window_start)
+        if overlap > timedelta(0):
+            total += overlap
+    return total
 
-    weekday_mask = (day_of_week <= 4) & (hour >= 7) & (hour < 18)
-    weekend_mask = (day_of_week >= 5) & (hour >= 8) & (hour < 16)
 
-    valid_minutes = time_range[weekday_mask | weekend_mask]
-    return timedelta(minutes=len(valid_minutes))
+def business_minutes_vectorized(created: np.ndarray, resolved: np.ndarray) -> np.ndarray:
+    """Counts Swedish business minutes for every ticket in one pass.
+
+    Closed-form replacement for applying get_swedish_business_hours row by
+    row: whole days between Created and Resolved are summed via a cumulative
+    weekday lookup, and the partial start/end days are clipped against that
+    day's business window. Returns an int64 array of minutes.
+    """
+    created = created.astype('datetime64[m]')
+    resolved = resolved.astype('datetime64[m]')
+    valid = ~(np.isnat(created) | np.isnat(resolved)) & (resolved > created)
+
+    if not valid.any():
+        return np.zeros(len(created), dtype=np.int64)
+
+    if _HAS_NUMBA and created.size > NUMBA_MIN_ROWS:
+        return business_minutes_njit(created.astype(np.int64), resolved.astype(np.int64), valid)
+
+    # Park invalid rows on a real date so the day math stays NaT-free;
+    # they are zeroed out at the end.
+    fill = created[valid].min()
+    start = np.where(valid, created, fill)
+    end = np.where(valid, resolved, fill)
+
+    start_day = start.astype('datetime64[D]')
+    end_day = end.astype('datetime64[D]')
+    start_mod = (start - start_day).astype(np.int64)  # minute of day
+    end_mod = (end - end_day).astype(np.int64)
+
+    # Cumulative business minutes over the covered day span, so full days
+    # between any two dates become a single subtraction.
+    day0 = start_day.min()
+    start_idx = (start_day - day0).astype(np.int64)
+    end_idx = (end_day - day0).astype(np.int64)
+    n_days = int(end_idx.max()) + 1
+    weekdays = (day0.astype(np.int64) + np.arange(n_days) + 3) % 7  # epoch day 0 is a Thursday
+    cum_minutes = np.concatenate(([0], np.cumsum(DAILY_BUSINESS_MINUTES[weekdays])))
+
+    open_s = BUSINESS_WINDOWS[weekdays[start_idx], 0]
+    close_s = BUSINESS_WINDOWS[weekdays[start_idx], 1]
+    open_e = BUSINESS_WINDOWS[weekdays[end_idx], 0]
+    close_e = BUSINESS_WINDOWS[weekdays[end_idx], 1]
+
+    head = np.clip(close_s - np.maximum(start_mod, open_s), 0, None)
+    tail = np.clip(np.minimum(end_mod, close_e) - open_e, 0, None)
+    middle = cum_minutes[end_idx] - cum_minutes[np.minimum(start_idx + 1, end_idx)]
+    same_day = np.clip(np.minimum(end_mod, close_s) - np.maximum(start_mod, open_s), 0, None)
+
+    minutes = np.where(start_idx == end_idx, same_day, head + middle + tail)
+    return np.where(valid, minutes, 0)
 
 
 # --- ANOMALY & LOGGING LOGIC ---
@@ -100,6 +261,44 @@ def detect_metric_anomaly(series, sigma_threshold=2):
         return "STABLE PERFORMANCE", "#0C868A"
 
 
+# Status labels and colors indexed by the codes detect_metric_anomaly_batch
+# produces (0=critical, 1=decrease, 2=improvement, 3=stable).
+ANOMALY_STATUSES = np.array(["CRITICAL PERFORMANCE DROP", "UNUSUAL DECREASE",
+                             "SIGNIFICANT IMPROVEMENT", "STABLE PERFORMANCE"])
+ANOMALY_COLORS = np.array(["#F70D1A", "#FFBF00", "#228B22", "#0C868A"])
+
+
+def detect_metric_anomaly_batch(metrics, sigma_threshold=2):
+    """
+    Batch version of detect_metric_anomaly for a (n_metrics, n_timesteps)
+    array: mean/std/z-score run as whole-array kernels and the verdicts come
+    from one np.select, instead of one Python call per metric.
+    Returns (statuses, colors) arrays aligned with the input rows.
+    """
+    metrics = np.atleast_2d(np.asarray(metrics, dtype=float))
+    n_metrics = metrics.shape[0]
+
+    if metrics.shape[1] < 3:
+        return (np.full(n_metrics, "INSUFFICIENT DATA"),
+                np.full(n_metrics, "#64748b"))
+
+    if _HAS_NUMBA and n_metrics > NUMBA_MIN_ROWS:
+        z_scores = zscore_last_njit(metrics)
+    else:
+        baseline = metrics[:, :-1]
+        mu = baseline.mean(axis=1)
+        std = baseline.std(axis=1, ddof=1)
+        std = np.where(std == 0, 0.001, std)
+        z_scores = (metrics[:, -1] - mu) / std
+
+    codes = np.select(
+        [z_scores < -(sigma_threshold + 1), z_scores < -sigma_threshold, z_scores > sigma_threshold],
+        [0, 1, 2],
+        default=3
+    )
+    return ANOMALY_STATUSES[codes], ANOMALY_COLORS[codes]
+
+
 def log_anomaly(metric_name, status, color):
     """Logs to file and triggers email on critical anomalies."""
     global last_alert_sent
@@ -125,97 +324,167 @@ def log_anomaly(metric_name, status, color):
 # --- CORE DASHBOARD FUNCTIONS ---
 
 def calculate_metrics(df):
-    df = df.copy()
+    # Shallow copy: the returned frame gets its own column index so the new
+    # metric columns never land on the caller's frame, but the existing data
+    # blocks are shared instead of deep-copied.
+    df = df.copy(deep=False)
     df['Created'] = pd.to_datetime(df['Created'])
     df['Resolved'] = pd.to_datetime(df['Resolved'])
-    business_timedeltas = df.apply(get_swedish_business_hours, axis=1)
-    df['Resolution_duration'] = business_timedeltas.apply(format_duration)
-    df['MTTR'] = business_timedeltas.dt.total_seconds() / 3600
+    df['MTTR_minutes'] = business_minutes_vectorized(df['Created'].to_numpy(), df['Resolved'].to_numpy())
+    df['Resolution_duration'] = format_duration_vec(df['MTTR_minutes'].to_numpy() * 60).to_numpy()
+    df['MTTR'] = df['MTTR_minutes'] / 60.0
     targets = {'1': 4, '2': 8, '3': 120, '4': 240}
 
-    def check_sla(row):
-        prio = str(row['Priority'])
-        p_digit = next((s for s in prio if s.isdigit()), '3')
-        return "Compliant" if row['MTTR'] <= targets.get(p_digit, 120) else "Breach"
-
-    df['SLA'] = df.apply(check_sla, axis=1)
+    # Vectorized SLA check: resolve each priority to its target hours once,
+    # then compare the whole MTTR column in one go.
+    if isinstance(df['Priority'].dtype, pd.CategoricalDtype):
+        # One threshold per category, gathered through the int8 codes — no
+        # per-row string extraction or dict hashing.
+        categories = df['Priority'].cat.categories.astype(str)
+        category_thresholds = np.array(
+            [targets.get(next((ch for ch in c if ch.isdigit()), '3'), 120) for c in categories],
+            dtype=np.int32)
+        codes = df['Priority'].cat.codes.to_numpy()
+        if len(category_thresholds) == 0:
+            thresholds = np.full(len(df), 120, dtype=np.int32)
+        else:
+            thresholds = np.where(codes >= 0, category_thresholds[np.clip(codes, 0, None)], 120)
+    else:
+        prio_digit = df['Priority'].astype(str).str.extract(r'(\d)', expand=False).fillna('3')
+        thresholds = prio_digit.map(targets).fillna(120).to_numpy()
+    df['SLA_ok'] = df['MTTR'].to_numpy() <= thresholds
+    df['SLA'] = pd.Categorical(
+        np.where(df['SLA_ok'], 'Compliant', 'Breach'),
+        categories=['Compliant', 'Breach']
+    )
     return df
 
 
+# FCR population definitions. Frozensets give O(1) membership hashing, and
+# _isin_via_codes reduces the per-row test to an int8 code gather whenever
+# the column is categorical.
+L1_GROUPS = frozenset([
+    'Service Desk L1 Sweden', 'Service Desk L1 Finland', 'Service Desk L1 Denmark',
+    'Service Desk L1 Norge', 'Service Desk L1 English'
+])
+RESOLUTION_CODES = frozenset(['Solved (Permanently)', 'Solved Remotely (Permanently)'])
+
+
+def _isin_via_codes(col, values):
+    """Boolean membership mask for a column against a set of strings.
+
+    Categorical columns are tested once per category and the verdicts are
+    gathered through the int8 codes; anything else falls back to the
+    normalize-and-isin scan.
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        in_set = col.cat.categories.astype('string').str.strip().isin(values)
+        codes = col.cat.codes.to_numpy()
+        mask = np.zeros(len(col), dtype=bool)
+        observed = codes >= 0
+        mask[observed] = in_set[codes[observed]]
+        return mask
+    return col.astype('string').str.strip().isin(values).to_numpy()
+
+
+# Loop-invariant pieces of the FCR gauges: the Indicator spec, layout and
+# wrapper styles are identical for every month, so they are built once here
+# and only value/delta/title get patched per gauge.
+GAUGE_INDICATOR_TEMPLATE = {
+    'mode': "gauge+number+delta",
+    'delta': {
+        'relative': False,
+        'increasing': {'color': "#228B22"},
+        'decreasing': {'color': "#F70D1A"},
+        'position': "top",
+        'font': {'size': 15}
+    },
+    'number': {
+        'suffix': "%",
+        'font': {'size': 22, 'color': '#000000', 'family': 'Verdana'}
+    },
+    'title': {'font': {'size': 14, 'color': '#334155'}},
+    'gauge': {
+        'shape': "angular",
+        'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "#B7C0C7"},
+        'bar': {'color': "black", 'thickness': 0.15},
+        'bgcolor': "white",
+        'borderwidth': 2,
+        'bordercolor': "#CAD3D9",
+        'steps': [
+            {'range': [0, 80], 'color': "#F70D1A"},
+            {'range': [80, 95], 'color': "#FFBF00"},
+            {'range': [95, 100], 'color': "#228B22"}
+        ],
+        'threshold': {
+            'line': {'color': "black", 'width': 4},
+            'thickness': 1,
+            'value': 95
+        }
+    }
+}
+
+GAUGE_LAYOUT_TEMPLATE = {
+    'height': 180,
+    'margin': {'l': 15, 'r': 15, 't': 50, 'b': 10},
+    'paper_bgcolor': 'rgba(0,0,0,0)',
+    'font': {'family': "Verdana"}
+}
+
+GAUGE_GRAPH_CONFIG = {'displayModeBar': False}
+GAUGE_DIV_STYLE = {'width': '33%', 'display': 'inline-block'}
+
+
 def get_fcr_gauges(df):
     """Generates a list of 6 monthly FCR gauges with speedometer style."""
+    import plotly.graph_objects as go
+    from dash import html, dcc
+
     if df.empty:
         return [html.P("No data available for FCR.")]
 
-    l1_groups = ['Service Desk L1 Sweden', 'Service Desk L1 Finland', 'Service Desk L1 Denmark',
-                 'Service Desk L1 Norge', 'Service Desk L1 English']
-    resolution_codes = ['Solved (Permanently)', 'Solved Remotely (Permanently)']
+    # Membership masks are computed once over the whole frame (per category
+    # where possible) and both counts come out of a single groupby, instead
+    # of re-filtering and re-stripping per month. The month key is reused
+    # when the caller has already derived it (the dashboard does at boot).
+    if 'Month_Period' in df.columns:
+        month_period = df['Month_Period']
+    else:
+        month_period = pd.to_datetime(df['Created'], errors='coerce').dt.to_period('M')
+    l1_started_mask = _isin_via_codes(df['First_Assignment_group'], L1_GROUPS)
+    if '_is_resolved' in df.columns:
+        resolved_mask = df['_is_resolved'].to_numpy()
+    else:
+        resolved_mask = _isin_via_codes(df['Resolution_code'], RESOLUTION_CODES)
+    fcr_mask = (l1_started_mask
+                & _isin_via_codes(df['Assignment_group'], L1_GROUPS)
+                & resolved_mask)
 
-    df['Created'] = pd.to_datetime(df['Created'], errors='coerce')
-    df = df.dropna(subset=['Created'])
-    df['Month_Period'] = df['Created'].dt.to_period('M')
+    monthly = (pd.DataFrame({'Month_Period': month_period,
+                             'l1': l1_started_mask, 'fcr': fcr_mask})
+               .dropna(subset=['Month_Period'])
+               .groupby('Month_Period', sort=True, observed=True)[['l1', 'fcr']].sum())
 
-    months = sorted(df['Month_Period'].unique())[-6:]
     gauge_list = []
     prev_val = None
 
-    for m in months:
-        month_df = df[df['Month_Period'] == m]
-        l1_started = month_df[month_df['First_Assignment_group'].astype(str).str.strip().isin(l1_groups)]
-
-        fcr_tickets = l1_started[
-            (l1_started['Assignment_group'].astype(str).str.strip().isin(l1_groups)) &
-            (l1_started['Resolution_code'].astype(str).str.strip().isin(resolution_codes))
-            ]
-
-        val = (len(fcr_tickets) / len(l1_started) * 100) if len(l1_started) > 0 else 0
-
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=val,
-            delta={
-                'reference': prev_val if prev_val is not None else val,
-                'relative': False,
-                'increasing': {'color': "#228B22"},
-                'decreasing': {'color': "#F70D1A"},
-                'position': "top",
-                'font': {'size': 15}
-            },
-            number={
-                'suffix': "%",
-                'font': {'size': 22, 'color': '#000000', 'family': 'Verdana'}
-            },
-            title={'text': f"<b>{m.strftime('%b %Y')}</b>", 'font': {'size': 14, 'color': '#334155'}},
-            gauge={
-                'shape': "angular",
-                'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "#B7C0C7"},
-                'bar': {'color': "black", 'thickness': 0.15},
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "#CAD3D9",
-                'steps': [
-                    {'range': [0, 80], 'color': "#F70D1A"},
-                    {'range': [80, 95], 'color': "#FFBF00"},
-                    {'range': [95, 100], 'color': "#228B22"}
-                ],
-                'threshold': {
-                    'line': {'color': "black", 'width': 4},
-                    'thickness': 1,
-                    'value': 95
-                }
-            }
-        ))
+    for m, row in monthly.tail(6).iterrows():
+        val = (row['fcr'] / row['l1'] * 100) if row['l1'] > 0 else 0
 
-        fig.update_layout(
-            height=180,
-            margin=dict(l=15, r=15, t=50, b=10),
-            paper_bgcolor='rgba(0,0,0,0)',
-            font={'family': "Verdana"}
-        )
+        spec = {
+            **GAUGE_INDICATOR_TEMPLATE,
+            'value': val,
+            'delta': {**GAUGE_INDICATOR_TEMPLATE['delta'],
+                      'reference': prev_val if prev_val is not None else val},
+            'title': {**GAUGE_INDICATOR_TEMPLATE['title'],
+                      'text': f"<b>{m.strftime('%b %Y')}</b>"},
+        }
+        fig = go.Figure({'data': [{'type': 'indicator', **spec}],
+                         'layout': GAUGE_LAYOUT_TEMPLATE})
 
         gauge_list.append(html.Div(
-            dcc.Graph(figure=fig, config={'displayModeBar': False}),
-            style={'width': '33%', 'display': 'inline-block'}
+            dcc.Graph(figure=fig, config=GAUGE_GRAPH_CONFIG),
+            style=GAUGE_DIV_STYLE
         ))
         prev_val = val
 
@@ -223,84 +492,42 @@ def get_fcr_gauges(df):
 
 
 def get_mttr_trend_data(df, selected_month):
-    """Filters and aggregates MTTR stats."""
-    df_copy = df.copy()
-    df_copy['Month_Str'] = df_copy['Created'].dt.strftime('%Y-%m')
-    filtered_df = df_copy[df_copy['Month_Str'] == selected_month].copy()
+    """Filters and aggregates MTTR stats for the selected month."""
+    cols = ['Day', 'MTTR'] if 'Day' in df.columns else ['Created', 'MTTR']
+    if df.index.name == 'Month_Str':
+        # Dashboard path: the frame is pre-indexed and sorted by month, so
+        # the slice is an index lookup instead of an O(N) strftime + scan.
+        if selected_month not in df.index:
+            return pd.DataFrame()
+        filtered_df = df.loc[[selected_month], cols]
+    else:
+        month_str = df['Created'].dt.strftime('%Y-%m')
+        filtered_df = df.loc[month_str == selected_month, cols]
 
     if filtered_df.empty:
         return pd.DataFrame()
 
-    filtered_df['Day'] = filtered_df['Created'].dt.day
-    mttr_stats = filtered_df.groupby('Day')['MTTR'].agg(['mean', 'median', 'count']).reset_index()
-    mttr_stats = mttr_stats.sort_values('Day')
-
-    def hours_to_hms(h):
-        if pd.isna(h): return "00:00:00"
-        td = timedelta(hours=h)
-        return format_duration(td)
-
-    mttr_stats['mean_label'] = mttr_stats['mean'].apply(hours_to_hms)
-    mttr_stats['median_label'] = mttr_stats['median'].apply(hours_to_hms)
-
-    return mttr_stats
-
-
-# Setup logging configuration
-logging.basicConfig(
-    filename='service_alerts.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-
-def send_email_alert(subject, body):
-    """Sends a formatted email alert."""
-    try:
-        msg = MIMEMultipart()
-        msg['From'] = SENDER_EMAIL
-        msg['To'] = RECEIVER_EMAIL
-        msg['Subject'] = subject
-        msg.attach(MIMEText(body, 'plain'))
-
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        server.login(SENDER_EMAIL, EMAIL_PASSWORD)
-        server.send_message(msg)
-        server.quit()
-    except Exception as e:
-        logging.error(f"Failed to send email: {e}")
-
-
-# Global dictionary to prevent spam (Cool-down)
-last_alert_sent = {}
-
-
-def log_anomaly(metric_name, status, color):
-    """Logs to file and sends email if critical."""
-    global last_alert_sent
-
-    if color == "#F70D1A":  # CRITICAL ONLY
-        severity = "CRITICAL"
-        current_time = datetime.now()
-
-        # Check if we've already emailed about this metric in the last 4 hours
-        last_time = last_alert_sent.get(metric_name)
-        if last_time is None or (current_time - last_time) > timedelta(hours=4):
-            # 1. Log to File
-            logging.critical(f"{metric_name} - {status}")
-
-            # 2. Send Email
-            subject = f"🚨 GOVERNANCE ALERT: {metric_name}"
-            body = f"""
-            Automatic Anomaly Detection Alert
-            ----------------------------------
-            Metric: {metric_name}
-            Status: {status}
-            Detected At: {current_time.strftime('%Y-%m-%d %H:%M:%S')}
-
-            Please check the Service Governance Dashboard for details.
-            """
-            send_email_alert(subject, body)
-
-            # Update last sent time
-            last_alert_sent[metric_name] = current_time
\ No newline at end of file
+    if 'Day' not in filtered_df.columns:
+        filtered_df = filtered_df.assign(Day=filtered_df['Created'].dt.day.astype('int8'))
+    if _HAS_NUMBA and len(filtered_df) > NUMBA_MIN_ROWS:
+        # One compiled pass over the month: sort by day, run-walk for
+        # mean/count, slice-sort for the median - no per-group pandas
+        # dispatch.
+        days_arr, means, medians, counts = mttr_day_stats_njit(
+            filtered_df['Day'].to_numpy(np.int64),
+            filtered_df['MTTR'].to_numpy(np.float64))
+        mttr_stats = pd.DataFrame(
+            {'Day': days_arr, 'mean': means, 'median': medians, 'count': counts})
+    else:
+        mttr_stats = filtered_df.groupby('Day', sort=True, observed=True)['MTTR'].agg(
+            ['mean', 'median', 'count']).reset_index()
+    # Small dtypes keep the Plotly payload light: 31 rows of float32/int32.
+    mttr_stats[['mean', 'median']] = mttr_stats[['mean', 'median']].astype('float32')
+    mttr_stats['count'] = mttr_stats['count'].astype('int32')
+
+    mttr_stats['mean_label'] = format_duration_vec(
+        (mttr_stats['mean'].fillna(0) * 3600).astype('int64').to_numpy()).to_numpy()
+    mttr_stats['median_label'] = format_duration_vec(
+        (mttr_stats['median'].fillna(0) * 3600).astype('int64').to_numpy()).to_numpy()
+
+    return mttr_stats
\ No newline at end of file
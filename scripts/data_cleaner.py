@@ -1,11 +1,13 @@
+import re
+
 import pandas as pd
 import numpy as np
-import random
 
 
 
 def run_cleaner():
     print("--- Service Management Tool ---")
+    rng = np.random.default_rng()
 
     try:
         # Loading data
@@ -18,9 +20,17 @@ def run_cleaner():
         # ANONYMIZATION & DATA MASKING
         print("--- ANONYMIZATION & DATA MASKING ---")
         # 2. ANONYMIZATION & DATA MASKING
-        print("[2/7] Masking PII and Anonymizing Company data...", end=" ")
-        # Global replace company_name -> Company
-        df = df.replace(to_replace=r'(?i)company_name', value='Company', regex=True)
+        print("[2/6] Masking PII and Anonymizing Company data...", end=" ")
+        # Both masking rules fused into one compiled alternation, applied in
+        # a single pass over the string columns: company names -> 'Company',
+        # (APxxxxxxx) tags -> removed
+        mask_pattern = re.compile(r'(?i:company_name)|\(AP\d{7}\)')
+
+        def mask_cell(match):
+            return '' if match.group().startswith('(AP') else 'Company'
+
+        for col in df.select_dtypes(include='object').columns:
+            df[col] = df[col].astype('string').str.replace(mask_pattern, mask_cell, regex=True)
         print("SUCCESS.")
 
         # 3. Replace 'Opened by' (Col J) with randomized names
@@ -31,53 +41,52 @@ def run_cleaner():
             with open("../data/last_name.txt", "r", encoding="utf-8") as f:
                 last_names = [line.strip() for line in f if line.strip()]
 
-        # Replace Opened_by with randomized full names
-        df['Opened_by'] = [
-            f"{random.choice(first_names)} {random.choice(last_names)}"
-            for _ in range(len(df)) ]
+        # Replace Opened_by with randomized full names (whole-column draw,
+        # no per-row Python loop)
+        df['Opened_by'] = np.char.add(
+            np.char.add(rng.choice(first_names, len(df)), ' '),
+            rng.choice(last_names, len(df)))
 
-        print("[3/7] Replacing 'Opened by' (Col J) with randomized names...")
+        print("[3/6] Replacing 'Opened by' (Col J) with randomized names...")
         print("SUCCESS.")
 
         # 4. GENERATE INCIDENT NUMBERS (Col A)
-        print("[4/7] Generating unique Incident Numbers (INCxxxxxxx)...", end=" ")
-        # Generates a list of INC followed by 7 random digits
-        df['Number'] = [f"INC{random.randint(1000000, 9999999)}" for _ in range(len(df))]
+        print("[4/6] Generating unique Incident Numbers (INCxxxxxxx)...", end=" ")
+        # Generates INC followed by 7 random digits in one vectorized draw
+        df['Number'] = np.char.add('INC', rng.integers(1_000_000, 10_000_000, len(df)).astype(str))
         print("SUCCESS.")
 
         # 5. DELETE SPECIFIED COLUMNS (Col E)
-        print("[5/7] Removing unnecessary columns (Short Description)...", end=" ")
-        # Drop Column E ('Short description')
-        if 'E' in df.columns:
-        df = df.drop(columns=['E'])
-        print("SUCCESS.")
-
-        # 6. DELETE SPECIFIC PATTERN
-        print("[6/7] Removing 'any_name_text' patterns from all cells...", end=" ")
-        # We replace it with an empty string
-        ap_pattern = r'\(AP\d{7}\)'
-        df = df.replace(to_replace=ap_pattern, value='', regex=True)
+        print("[5/6] Removing unnecessary columns (Short Description)...", end=" ")
+        # Drop Column E ('Short description') in place - no full-frame copy
+        cols_to_drop = [c for c in ('E', 'Short description') if c in df.columns]
+        if cols_to_drop:
+            df.drop(columns=cols_to_drop, inplace=True)
         print("SUCCESS.")
 
         # Agent assignment and Export
         print("--- Agent assignment and Expoty ---")
-        # 7. AGENT ASSIGNMENT & EXPORT
-        print("[7/7] Finalizing Agent Assignment and Export...", end=" ")
+        # 6. AGENT ASSIGNMENT & EXPORT
+        print("[6/6] Finalizing Agent Assignment and Export...", end=" ")
         # Create pool for Assigned To (Col G)
-        agent_names = [f"{random.choice(first_names)} {random.choice(last_names)}" for _ in range(1015)]
-
-        def assign_agent(group):
-            g = str(group)
-            if "L1" in g: return random.choice(agent_names[:40])
-            if "L2" in g: return random.choice(agent_names[40:50])
-            return random.choice(agent_names[50:])
-
-        df['Opened'] = df['Assigned_to'].apply(assign_agent)
-
-        df.to_excel('cleaned_6_months_temp.xlsx', index=False)
+        agent_names = np.char.add(
+            np.char.add(rng.choice(first_names, 1015), ' '),
+            rng.choice(last_names, 1015))
+
+        # Tiered pools (L1 / L2 / rest) picked per row with np.where over a
+        # single substring scan of the group column
+        groups = df['Assigned_to'].to_numpy().astype(str)
+        df['Opened'] = np.where(
+            np.char.find(groups, 'L1') >= 0, rng.choice(agent_names[:40], len(df)),
+            np.where(np.char.find(groups, 'L2') >= 0, rng.choice(agent_names[40:50], len(df)),
+                     rng.choice(agent_names[50:], len(df))))
+
+        # Parquet export: columnar, typed and compressed - the dashboard
+        # loads it in milliseconds where the xlsx took seconds to parse.
+        df.to_parquet('cleaned_6_months.parquet', engine='pyarrow', compression='zstd')
         print("SUCCESS.")
 
-        print(f"\nReport generated: cleaned_6_months_temp.xlsx")
+        print(f"\nReport generated: cleaned_6_months.parquet")
 
     except Exception as e:
         print(f"\nCRITICAL ERROR: {e}")